@@ -43,6 +43,7 @@ class Animation:
         self.pixel_object = pixel_object
         self.pixel_object.auto_write = False
         self._peers = [self] + peers if peers is not None else [self]
+        self._speed = 0
         self._speed_ms = 0
         self._color = None
         self._paused = paused
@@ -63,7 +64,7 @@ class Animation:
     def __str__(self):
         return "<%s: %s>" % (self.__class__.__name__, self.name)
 
-    def animate(self, show=True):
+    def animate(self, show=True, _monotonic_ms=monotonic_ms):
         """
         Call animate() from your code's main loop.  It will draw the animation draw() at intervals
         configured by the speed property (set from init).
@@ -71,31 +72,43 @@ class Animation:
         :param bool show: Whether to automatically call show on the pixel object when an animation
                           fires.  Default True.
         :return: True if the animation draw cycle was triggered, otherwise False.
+
+        ``_monotonic_ms`` is bound at definition time so the frequent "not yet
+        time" early return avoids a global lookup; do not pass it.
         """
         if self._paused:
             return False
 
-        now = monotonic_ms()
-        if now < self._next_update:
+        now = _monotonic_ms()
+        next_update = self._next_update
+        if now < next_update:
             return False
 
         # Draw related animations together
-        for anim in self._peers:
+        peers = self._peers
+        for anim in peers:
             anim.draw_count += 1
             anim.draw()
             anim.after_draw()
 
         if show:
-            for anim in self._peers:
+            for anim in peers:
                 anim.show()
 
         # Note that the main animation cycle_complete flag is used, not the peer flag.
-        for anim in self._peers:
+        for anim in peers:
             if anim.cycle_complete:
                 anim.cycle_complete = False
                 anim.on_cycle_complete()
 
-        self._next_update = now + self._speed_ms
+        # Advance from the scheduled tick, not from now, so a late caller does
+        # not accumulate drift; if we are more than one period behind, resync
+        # to avoid firing a burst of make-up frames.
+        speed_ms = self._speed_ms
+        next_update += speed_ms
+        if next_update < now - speed_ms:
+            next_update = now + speed_ms
+        self._next_update = next_update
         return True
 
     def draw(self):
@@ -155,6 +168,21 @@ class Animation:
         """
         self.pixel_object.fill(color)
         self.pixel_object.show()
+        self._buffer_filled(color)
+
+    def _buffer_filled(self, color):
+        """
+        Called after the pixel buffer is overwritten by a fill, including
+        fills of a shared strip performed by other members of an
+        AnimationGroup.  Override as needed.
+        """
+
+    def on_activated(self):
+        """
+        Called when an AnimationSequence switches to this animation, including
+        when cycling back to it.  Other members of the sequence may have drawn
+        over the pixel buffer in the meantime.  Override as needed.
+        """
 
     @property
     def color(self):
@@ -165,10 +193,13 @@ class Animation:
 
     @color.setter
     def color(self, color):
-        if self._color == color:
-            return
+        # Convert before comparing: _color is stored as a tuple, so comparing
+        # against a raw int would miss the early exit on repeated assignment
+        # of the same hex color.
         if isinstance(color, int):
             color = (color >> 16 & 0xFF, color >> 8 & 0xFF, color & 0xFF)
+        if self._color == color:
+            return
         self._set_color(color)
 
     def _set_color(self, color):
@@ -183,10 +214,11 @@ class Animation:
         """
         The animation speed in fractional seconds.
         """
-        return self._speed_ms / MS_PER_SECOND
+        return self._speed
 
     @speed.setter
     def speed(self, seconds):
+        self._speed = seconds
         self._speed_ms = int(seconds * MS_PER_SECOND)
 
     def on_cycle_complete(self):
@@ -196,7 +228,7 @@ class Animation:
         Override as needed.
         """
         self.cycle_count += 1
-        if self.cycle_count % self.notify_cycles == 0:
+        if self._also_notify and self.cycle_count % self.notify_cycles == 0:
             for callback in self._also_notify:
                 callback(self)
 
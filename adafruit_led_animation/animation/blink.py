@@ -43,4 +43,9 @@ class Blink(ColorCycle):
         super().__init__(pixel_object, speed, [color, BLACK], name=name)
 
     def _set_color(self, color):
-        self.colors = [color, BLACK]
+        # Keep the palette as a tuple and skip the rebuild when the on color
+        # is unchanged, e.g. from repeated AnimationSequence.color broadcasts.
+        # The generator keeps its phase either way.
+        if self.colors[0] == color:
+            return
+        self.colors = (color, BLACK)
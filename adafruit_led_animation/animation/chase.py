@@ -26,8 +26,6 @@ Implementation Notes
 
 """
 
-from math import ceil
-
 from adafruit_led_animation.animation import Animation
 
 
@@ -50,11 +48,17 @@ class Chase(Animation):
         self._size = size
         self._spacing = spacing
         self._repeat_width = size + spacing
-        self._num_repeats = ceil(len(pixel_object) / self._repeat_width)
-        self._overflow = len(pixel_object) % self._repeat_width
         self._direction = 1 if not reverse else -1
         self._reverse = reverse
         self._offset = 0
+        # When bar_color/space_color are not overridden the stripe pattern is
+        # periodic, so one tiled copy can be built ahead of time and rolled
+        # with a single slice assignment per frame.
+        self._pattern = None
+        self._use_pattern = (
+            type(self).bar_color is Chase.bar_color
+            and type(self).space_color is Chase.space_color
+        )
 
         def _resetter():
             self._offset = 0
@@ -79,26 +83,44 @@ class Chase(Animation):
         self._reverse = value
         self._direction = -1 if self._reverse else 1
 
+    def _set_color(self, color):
+        super()._set_color(color)
+        self._pattern = None
+
+    def _build_pattern(self):
+        period = [self.color] * self._size + [self.space_color(0)] * self._spacing
+        self._pattern = tuple(
+            period * (len(self.pixel_object) // self._repeat_width + 2)
+        )
+
     def draw(self):
-        def bar_colors():
-            bar_no = 0
-            for i in range(self._offset, 0, -1):
-                if i > self._spacing:
-                    yield self.bar_color(bar_no, i)
-                else:
-                    yield self.space_color(bar_no, i)
-                    bar_no = 1
-            while True:
-                for bar_pixel in range(self._size):
-                    yield self.bar_color(bar_no, bar_pixel)
-                for space_pixel in range(self._spacing):
-                    yield self.space_color(bar_no, space_pixel)
-                bar_no += 1
-
-        colorgen = bar_colors()
-        self.pixel_object[:] = [next(colorgen) for _ in range(len(self.pixel_object))]
-
-        if self.draw_count % len(self.pixel_object) == 0:
+        num_pixels = len(self.pixel_object)
+        if self._use_pattern:
+            if self._pattern is None:
+                self._build_pattern()
+            start = self._repeat_width - self._offset
+            self.pixel_object[:] = self._pattern[start : start + num_pixels]
+        else:
+
+            def bar_colors():
+                bar_no = 0
+                for i in range(self._offset, 0, -1):
+                    if i > self._spacing:
+                        yield self.bar_color(bar_no, i)
+                    else:
+                        yield self.space_color(bar_no, i)
+                        bar_no = 1
+                while True:
+                    for bar_pixel in range(self._size):
+                        yield self.bar_color(bar_no, bar_pixel)
+                    for space_pixel in range(self._spacing):
+                        yield self.space_color(bar_no, space_pixel)
+                    bar_no += 1
+
+            colorgen = bar_colors()
+            self.pixel_object[:] = [next(colorgen) for _ in range(num_pixels)]
+
+        if self.draw_count % num_pixels == 0:
             self.cycle_complete = True
         self._offset = (self._offset + self._direction) % self._repeat_width
 
@@ -55,10 +55,18 @@ class ColorCycle(Animation):
     def _color_generator(self):
         index = 0
         while True:
-            self._color = self.colors[index]
+            # One len() read per advance, so palette edits take effect
+            # without requiring a reset() and a shrunk palette cannot be
+            # indexed past its end.
+            colors = self.colors
+            num_colors = len(colors)
+            if index >= num_colors:
+                index = 0
+            self._color = colors[index]
             yield
-            index = (index + 1) % len(self.colors)
-            if index == 0:
+            index += 1
+            if index >= num_colors:
+                index = 0
                 self.cycle_complete = True
 
     def reset(self):
@@ -72,6 +72,7 @@ class Comet(Animation):
         self._tail_length = tail_length
         self._color_step = 0.95 / tail_length
         self._comet_colors = None
+        self._comet_colors_reversed = None
         self._computed_color = color
         self._background_color = background_color
         self._num_pixels = len(pixel_object)
@@ -82,18 +83,31 @@ class Comet(Animation):
         self._ring = ring
         if ring:
             self._left_side = 0
+        self._compute_start_positions()
         self.reset()
         super().__init__(pixel_object, speed, color, name=name)
+        self.steps_per_draw = 1
+        """Number of logical steps to advance per draw().  Values above 1 fuse
+        multiple tail advances into buffer writes with a single show(), which
+        helps when the strip transmission time exceeds the animation speed."""
 
     on_cycle_complete_supported = True
 
     def _set_color(self, color):
-        self._comet_colors = [self._background_color]
+        comet_colors = [self._background_color]
+        # Pack the computed shades as bytes: one small object per tail entry
+        # instead of a tuple of boxed ints.  DotStar colors with a float white
+        # level cannot be packed and stay as tuples.
+        pack = len(color) != 4 or not isinstance(color[3], float)
         for n in range(self._tail_length):
-            self._comet_colors.append(
-                calculate_intensity(color, n * self._color_step + 0.05)
-            )
+            shade = calculate_intensity(color, n * self._color_step + 0.05)
+            comet_colors.append(bytes(shade) if pack else shade)
+        # Freeze the tail palette (and a reversed copy) once per color change so
+        # draw() can blit slices of it without per-frame list building.
+        self._comet_colors = tuple(comet_colors)
+        self._comet_colors_reversed = self._comet_colors[::-1]
         self._computed_color = color
+        self._color = color
 
     @property
     def reverse(self):
@@ -120,53 +134,76 @@ class Comet(Animation):
             raise ValueError("Cannot combine bounce and ring mode")
         self._ring = value
         self._left_side = 0 if value else -self._tail_length
+        self._compute_start_positions()
         self.reset()
 
+    def _compute_start_positions(self):
+        # Both traversal start points depend only on the strip length, tail
+        # length and ring mode, so compute them once here rather than on
+        # every reset() at the end of each strip traversal.
+        self._fwd_start = -self._tail_length - 1
+        self._rev_start = self._num_pixels + self._tail_length + 1
+        if self._ring:
+            self._fwd_start %= self._num_pixels
+            self._rev_start %= self._num_pixels
+
     def draw(self):
-        colors = self._comet_colors
-        if self.reverse:
-            colors = reversed(colors)
+        for _ in range(self.steps_per_draw):
+            self._draw_step()
 
+    def _draw_step(self):
+        reverse = self._reverse
+        colors = self._comet_colors_reversed if reverse else self._comet_colors
+        num_colors = len(colors)
         pixels = self.pixel_object
         start = self._tail_start
-        npixels = len(pixels)
+        npixels = self._num_pixels
         if self._ring:
             start %= npixels
-            for color in colors:
-                pixels[start] = color
-                start += 1
-                if start == npixels:
-                    start = 0
-        else:
-            for color in colors:
-                if start >= npixels:
-                    break
-                if start >= 0:
+            if start + num_colors <= npixels:
+                pixels[start : start + num_colors] = colors
+            elif num_colors <= npixels:
+                split = npixels - start
+                pixels[start:] = colors[:split]
+                pixels[: num_colors - split] = colors[split:]
+            else:
+                # Tail longer than the ring: wrap pixel by pixel so later tail
+                # colors overwrite earlier ones.
+                for color in colors:
                     pixels[start] = color
-                start += 1
-
-        self._tail_start += self._direction
-
-        if self._tail_start < self._left_side or (
-            self._tail_start >= self._right_side and not self._reverse
+                    start += 1
+                    if start == npixels:
+                        start = 0
+        else:
+            first = max(start, 0)
+            last = min(start + num_colors, npixels)
+            if last - first == num_colors:
+                # Steady state: the whole tail is visible, no slicing needed.
+                pixels[first:last] = colors
+            elif first < last:
+                pixels[first:last] = colors[first - start : last - start]
+
+        tail_start = self._tail_start = self._tail_start + self._direction
+
+        if tail_start < self._left_side or (
+            tail_start >= self._right_side and not reverse
         ):
-            if self.bounce:
-                self.reverse = not self.reverse
-            elif self._ring:
-                self._tail_start = self._tail_start % self._num_pixels
-            else:
-                self.reset()
+            self._end_traversal(tail_start)
+
+    def _end_traversal(self, tail_start):
+        # The tail ran off (or around) the strip; only happens once per
+        # traversal, so the extra call does not slow the steady state.
+        if self.bounce:
+            self.reverse = not self._reverse
+        elif self._ring:
+            self._tail_start = tail_start % self._num_pixels
+        else:
+            self.reset()
 
-            self.cycle_complete = True
+        self.cycle_complete = True
 
     def reset(self):
         """
         Resets to the first state.
         """
-        if self.reverse:
-            self._tail_start = self._num_pixels + self._tail_length + 1
-        else:
-            self._tail_start = -self._tail_length - 1
-
-        if self._ring:
-            self._tail_start = self._tail_start % self._num_pixels
+        self._tail_start = self._rev_start if self._reverse else self._fwd_start
@@ -74,6 +74,7 @@ class MulticolorComet(Comet):
         self._tail_length = tail_length
 
         self._comet_colors = None
+        self._comet_colors_reversed = None
 
         self._num_pixels = len(pixel_object)
         self._direction = -1 if reverse else 1
@@ -88,7 +89,6 @@ class MulticolorComet(Comet):
         self._off_pixels = off_pixels
         if ring:
             self._left_side = 0
-        self.reset()
         super().__init__(
             pixel_object,
             speed,
@@ -104,11 +104,14 @@ class MulticolorComet(Comet):
 
     def _set_color(self, color):
         if self._off_pixels:
-            self._comet_colors = [BLACK]
+            comet_colors = [BLACK]
         else:
-            self._comet_colors = []
+            comet_colors = []
 
         for n in range(self._tail_length):
             _float_index = ((len(self._colors)) / self._tail_length) * n
             _color_index = int(_float_index)
-            self._comet_colors.append(self._colors[_color_index])
+            comet_colors.append(self._colors[_color_index])
+        self._comet_colors = tuple(comet_colors)
+        self._comet_colors_reversed = self._comet_colors[::-1]
+        self._color = color
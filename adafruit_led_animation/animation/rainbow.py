@@ -29,6 +29,14 @@ from adafruit_led_animation.animation import Animation
 from adafruit_led_animation.color import BLACK, colorwheel
 from adafruit_led_animation import MS_PER_SECOND, monotonic_ms
 
+try:
+    from ulab import numpy as np
+except ImportError:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LED_Animation.git"
 
@@ -51,10 +59,11 @@ class Rainbow(Animation):
         self, pixel_object, speed, period=5, step=1, name=None, precompute_rainbow=True
     ):
         super().__init__(pixel_object, speed, BLACK, name=name)
-        self._period = period
+        self._period_ms = int(period * MS_PER_SECOND)
         self._step = step
         self._wheel_index = 0
         self.colors = None
+        self._colors_array = None
         self._generator = self._color_wheel_generator()
         if precompute_rainbow:
             self.generate_rainbow()
@@ -62,6 +71,7 @@ class Rainbow(Animation):
     def generate_rainbow(self):
         """Generates the rainbow."""
         self.colors = []
+        self._colors_array = None
         i = 0
         while i < 256:
             self.colors.append(colorwheel(int(i)))
@@ -69,8 +79,20 @@ class Rainbow(Animation):
 
     on_cycle_complete_supported = True
 
+    @property
+    def period(self):
+        """
+        The period to cycle the rainbow over, in fractional seconds.
+        """
+        return self._period_ms / MS_PER_SECOND
+
+    @period.setter
+    def period(self, period):
+        self._period_ms = int(period * MS_PER_SECOND)
+
     def _color_wheel_generator(self):
-        period = int(self._period * MS_PER_SECOND)
+        # Stored in integer milliseconds so the hot loop stays in int math.
+        period = self._period_ms
 
         num_pixels = len(self.pixel_object)
         last_update = monotonic_ms()
@@ -85,14 +107,15 @@ class Rainbow(Animation):
             if pos < last_pos:
                 cycle_completed = True
             last_pos = pos
-            wheel_index = int((pos / period) * len(self.colors))
 
             if self.colors:
+                wheel_index = int((pos / period) * len(self.colors))
                 self._draw_precomputed(num_pixels, wheel_index)
             else:
                 wheel_index = int((pos / period) * 256)
+                wheel = colorwheel
                 self.pixel_object[:] = [
-                    colorwheel((i + wheel_index) % 255) for i in range(num_pixels)
+                    wheel((i + wheel_index) % 255) for i in range(num_pixels)
                 ]
             self._wheel_index = wheel_index
             if cycle_completed:
@@ -100,20 +123,36 @@ class Rainbow(Animation):
             yield
 
     def _draw_precomputed(self, num_pixels, wheel_index):
-        for i in range(0, num_pixels, len(self.colors)):
-            num = len(self.colors)
-            if i + len(self.colors) > num_pixels:
-                num = num_pixels - i
-            if wheel_index + num > len(self.colors):
-                colors_left = len(self.colors) - wheel_index
-                self.pixel_object[i : i + colors_left] = self.colors[wheel_index:]
-                self.pixel_object[i + colors_left : i + num] = self.colors[
-                    : num - colors_left
-                ]
-            else:
-                self.pixel_object[i : i + num] = self.colors[
-                    wheel_index : wheel_index + num
-                ]
+        # Rotate the precomputed palette once, tile it to the strip length and
+        # store it with a single slice assignment.  With ulab/numpy available
+        # the rotation and tiling happen on a uint8 array instead of a list.
+        if np is not None:
+            if self._colors_array is None:
+                self._colors_array = np.array(
+                    [
+                        (c >> 16 & 0xFF, c >> 8 & 0xFF, c & 0xFF)
+                        if isinstance(c, int)
+                        else c
+                        for c in self.colors
+                    ],
+                    dtype=np.uint8,
+                )
+            colors = self._colors_array
+            rotated = np.concatenate((colors[wheel_index:], colors[:wheel_index]))
+            if num_pixels > len(colors):
+                rotated = np.concatenate(
+                    tuple([rotated] * (num_pixels // len(colors) + 1))
+                )
+            self.pixel_object[:] = rotated[:num_pixels]
+            return
+        colors = self.colors
+        rotated = colors[wheel_index:] + colors[:wheel_index]
+        if num_pixels <= len(colors):
+            self.pixel_object[:] = rotated[:num_pixels]
+        else:
+            self.pixel_object[:] = (rotated * (num_pixels // len(colors) + 1))[
+                :num_pixels
+            ]
 
     def draw(self):
         next(self._generator)
@@ -69,10 +69,10 @@ class RainbowComet(Comet):
         )
 
     def _set_color(self, color):
-        self._comet_colors = [BLACK]
+        comet_colors = [BLACK]
         for n in range(self._tail_length):
             invert = self._tail_length - n - 1
-            self._comet_colors.append(
+            comet_colors.append(
                 calculate_intensity(
                     colorwheel(
                         int((invert * self._colorwheel_step) + self._colorwheel_offset)
@@ -81,4 +81,7 @@ class RainbowComet(Comet):
                     n * self._color_step + 0.05,
                 )
             )
+        self._comet_colors = tuple(comet_colors)
+        self._comet_colors_reversed = self._comet_colors[::-1]
         self._computed_color = color
+        self._color = color
@@ -38,7 +38,30 @@ class Solid(ColorCycle):
     """
 
     def __init__(self, pixel_object, color, name=None):
+        self._painted = False
         super().__init__(pixel_object, speed=1, colors=[color], name=name)
 
     def _set_color(self, color):
         self.colors = [color]
+        # Sync _color directly: the cycle generator only picks up the palette
+        # change on its next advance, which the repaint below must not wait on.
+        self._color = color
+        self._painted = False
+
+    def draw(self):
+        # A solid color only needs to hit the pixel buffer once; repaint only
+        # after the color changes or the buffer is cleared.
+        if self._painted:
+            return
+        super().draw()
+        self._painted = True
+
+    def _buffer_filled(self, color):
+        self._painted = False
+
+    def on_activated(self):
+        self._painted = False
+
+    def reset(self):
+        super().reset()
+        self._painted = False
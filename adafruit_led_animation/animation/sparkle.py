@@ -66,30 +66,46 @@ class Sparkle(Animation):
     def _set_color(self, color):
         half_color = tuple(color[rgb] // 4 for rgb in range(len(color)))
         dim_color = tuple(color[rgb] // 10 for rgb in range(len(color)))
-        for pixel in range(  # pylint: disable=consider-using-enumerate
-            len(self.pixel_object)
-        ):
-            if self.pixel_object[pixel] == self._half_color:
-                self.pixel_object[pixel] = half_color
-            elif self.pixel_object[pixel] == self._dim_color:
-                self.pixel_object[pixel] = dim_color
+        # Repaint only the most recently lit sparkles rather than scanning the
+        # whole strip for pixels matching the old colors; subsequent draws
+        # overwrite any older leftovers as new sparkles land on them.
+        pixel_object = self.pixel_object
+        num_pixels = self._num_pixels
+        for pixel in self._pixels:
+            if pixel_object[pixel % num_pixels] == self._half_color:
+                pixel_object[pixel % num_pixels] = half_color
+            if pixel_object[(pixel + 1) % num_pixels] == self._dim_color:
+                pixel_object[(pixel + 1) % num_pixels] = dim_color
         self._half_color = half_color
         self._dim_color = dim_color
         self._sparkle_color = color
-
-    def _random_in_mask(self):
-        if len(self._mask) == 0:
-            return random.randint(0, (len(self.pixel_object) - 1))
-        return self._mask[random.randint(0, (len(self._mask) - 1))]
+        self._color = color
 
     def draw(self):
-        self._pixels = [self._random_in_mask() for _ in range(self._num_sparkles)]
-        for pixel in self._pixels:
-            self.pixel_object[pixel] = self._sparkle_color
+        # Bind everything touched per sparkle to locals; attribute lookups in
+        # this loop dominate the draw cost for larger sparkle counts.
+        rand = random.randint
+        mask = self._mask
+        if mask:
+            last = len(mask) - 1
+            pixels = [mask[rand(0, last)] for _ in range(self._num_sparkles)]
+        else:
+            last = len(self.pixel_object) - 1
+            pixels = [rand(0, last) for _ in range(self._num_sparkles)]
+        pixel_object = self.pixel_object
+        color = self._sparkle_color
+        for pixel in pixels:
+            pixel_object[pixel] = color
+        self._pixels = pixels
 
     def after_draw(self):
         self.show()
+        pixel_object = self.pixel_object
+        num_pixels = self._num_pixels
+        half_color = self._half_color
+        dim_color = self._dim_color
+        mask = self._mask
         for pixel in self._pixels:
-            self.pixel_object[pixel % self._num_pixels] = self._half_color
-            if (pixel + 1) % self._num_pixels in self._mask:
-                self.pixel_object[(pixel + 1) % self._num_pixels] = self._dim_color
+            pixel_object[pixel % num_pixels] = half_color
+            if (pixel + 1) % num_pixels in mask:
+                pixel_object[(pixel + 1) % num_pixels] = dim_color
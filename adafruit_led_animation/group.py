@@ -119,7 +119,7 @@ class AnimationGroup:
         Override as needed.
         """
         self.cycle_count += 1
-        if self.cycle_count % self.notify_cycles == 0:
+        if self._also_notify and self.cycle_count % self.notify_cycles == 0:
             for callback in self._also_notify:
                 callback(self)
 
@@ -139,11 +139,12 @@ class AnimationGroup:
 
         :return: True if any animation draw cycle was triggered, otherwise False.
         """
+        members = self._members
         if self._sync:
-            result = self._members[0].animate(show=False)
+            result = members[0].animate(show=False)
             if result and show:
                 last_strip = None
-                for member in self._members:
+                for member in members:
                     if isinstance(member, Animation):
                         if last_strip != member.pixel_object:
                             member.pixel_object.show()
@@ -153,7 +154,7 @@ class AnimationGroup:
             return result
 
         ret = False
-        for item in self._members:
+        for item in members:
             if item.animate(show):
                 ret = True
         return ret
@@ -172,10 +173,22 @@ class AnimationGroup:
 
     def fill(self, color):
         """
-        Fills all pixel objects in the group with a color.
+        Fills all pixel objects in the group with a color.  Strips shared by
+        several members are filled and pushed once.
         """
+        filled = []
         for item in self._members:
-            item.fill(color)
+            if isinstance(item, Animation):
+                pixel_object = item.pixel_object
+                if not any(pixel_object is obj for obj in filled):
+                    filled.append(pixel_object)
+                    item.fill(color)
+                else:
+                    # The strip was already filled and pushed; members sharing
+                    # it still need to hear their buffer was overwritten.
+                    item._buffer_filled(color)  # pylint: disable=protected-access
+            else:
+                item.fill(color)
 
     def freeze(self):
         """
@@ -191,6 +204,13 @@ class AnimationGroup:
         for item in self._members:
             item.resume()
 
+    def on_activated(self):
+        """
+        Notifies all members of the group that the group was activated.
+        """
+        for item in self._members:
+            item.on_activated()
+
     def reset(self):
         """
         Resets the animations in the group.
@@ -200,7 +220,15 @@ class AnimationGroup:
 
     def show(self):
         """
-        Draws the current animation group members.
+        Draws the current animation group members.  Strips shared by several
+        members are pushed once.
         """
+        shown = []
         for item in self._members:
-            item.show()
+            if isinstance(item, Animation):
+                pixel_object = item.pixel_object
+                if not any(pixel_object is obj for obj in shown):
+                    pixel_object.show()
+                    shown.append(pixel_object)
+            else:
+                item.show()
@@ -100,13 +100,15 @@ class AnimationSequence:
         self.clear_color = BLACK
         self._paused = False
         self._paused_at = 0
-        self._random = random_order
+        # Bound once so _advance() does not re-test random_order per advance.
+        self._advance_member = self.random if random_order else self.next
         self._also_notify = []
         self.cycle_count = 0
         self.notify_cycles = 1
         self.name = name
         if random_order:
             self._current = random.randint(0, len(self._members) - 1)
+        self._current_animation = self._members[self._current]
         self._color = None
         for member in self._members:
             member.add_cycle_complete_receiver(self._sequence_complete)
@@ -124,7 +126,7 @@ class AnimationSequence:
         Override as needed.
         """
         self.cycle_count += 1
-        if self.cycle_count % self.notify_cycles == 0:
+        if self._also_notify and self.cycle_count % self.notify_cycles == 0:
             for callback in self._also_notify:
                 callback(self)
 
@@ -142,8 +144,7 @@ class AnimationSequence:
         self._also_notify.append(callback)
 
     def _auto_advance(self):
-        if not self._advance_interval:
-            return
+        # Callers check _advance_interval; no need to re-test it here.
         now = monotonic_ms()
         if now - self._last_advance > self._advance_interval:
             self._last_advance = now
@@ -154,10 +155,7 @@ class AnimationSequence:
             self.current_animation.reset()
         if self.auto_clear:
             self.current_animation.fill(self.clear_color)
-        if self._random:
-            self.random()
-        else:
-            self.next()
+        self._advance_member()
 
     def activate(self, index):
         """
@@ -167,6 +165,8 @@ class AnimationSequence:
             self._current = [member.name for member in self._members].index(index)
         else:
             self._current = index
+        self._current_animation = self._members[self._current]
+        self._current_animation.on_activated()
         if self._color:
             self.current_animation.color = self._color
 
@@ -201,14 +201,14 @@ class AnimationSequence:
         """
         if not self._paused and self._advance_interval:
             self._auto_advance()
-        return self.current_animation.animate(show)
+        return self._current_animation.animate(show)
 
     @property
     def current_animation(self):
         """
         Returns the current animation in the sequence.
         """
-        return self._members[self._current]
+        return self._current_animation
 
     @property
     def color(self):
@@ -251,6 +251,13 @@ class AnimationSequence:
         self._paused_at = 0
         self.current_animation.resume()
 
+    def on_activated(self):
+        """
+        Notifies the current animation that it was activated, for sequences
+        nested inside another sequence or group.
+        """
+        self.current_animation.on_activated()
+
     def reset(self):
         """
         Resets the current animation.